@@ -1,38 +1,56 @@
-from bs4 import BeautifulSoup
+from lxml import etree
 import csv
 
 INPUT_HTML = "input.html"
 OUTPUT_CSV = "words.csv"
+READ_CHUNK = 1 << 16
+WRITE_BUFFER_SIZE = 1 << 20
 
-def main():
-    # Read and parse the HTML
-    with open(INPUT_HTML, "r", encoding="utf-8") as f:
-        soup = BeautifulSoup(f, "lxml")  # or "html.parser"
+def iter_entries(f):
+    # Stream the HTML instead of building the whole DOM; the saved page is one huge line.
+    parser = etree.HTMLPullParser(events=("end",), tag="li", encoding="utf-8")
 
-    rows = []
+    for chunk in iter(lambda: f.read(READ_CHUNK), b""):
+        parser.feed(chunk)
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
 
+def iter_rows(f):
     # Each word/definition pair seems to live in an <li class="_2g-qq"> ... </li>
-    for li in soup.select("li._2g-qq"):
-        h3 = li.find("h3")
-        if not h3:
-            continue
-
-        p = h3.find_next("p")
-        if not p:
+    for _, li in iter_entries(f):
+        if "_2g-qq" not in (li.get("class") or "").split():
             continue
 
-        word = h3.get_text(strip=True)
-        definition = " ".join(p.stripped_strings)
+        # First <p> after the first <h3>, in document order within the entry
+        h3 = p = None
+        for el in li.iter("h3", "p"):
+            if h3 is None:
+                if el.tag == "h3":
+                    h3 = el
+            elif el.tag == "p":
+                p = el
+                break
+        if p is not None:
+            word = "".join(s.strip() for s in h3.itertext())
+            definition = " ".join(s.strip() for s in p.itertext() if s.strip())
+            yield word, definition
+
+        # Drop processed entries so only a handful of nodes stay alive
+        li.clear()
+        while li.getprevious() is not None:
+            del li.getparent()[0]
 
-        rows.append((word, definition))
-
-    # Write the CSV
-    with open(OUTPUT_CSV, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
+def main():
+    count = 0
+    with open(INPUT_HTML, "rb") as f_in, \
+            open(OUTPUT_CSV, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f_out:
+        writer = csv.writer(f_out)
         writer.writerow(["word", "definition"])
-        writer.writerows(rows)
+        for count, row in enumerate(iter_rows(f_in), start=1):
+            writer.writerow(row)
 
-    print(f"Wrote {len(rows)} rows to {OUTPUT_CSV}")
+    print(f"Wrote {count} rows to {OUTPUT_CSV}")
 
 if __name__ == "__main__":
     main()
@@ -15,6 +15,7 @@ Input:
 Batching:
 - Sends ONLY the words (one per line) to Ollama
 - Expects NDJSON back: {"word":"...","definition":"..."} per line
+- Keeps up to --concurrency batches in flight (set OLLAMA_NUM_PARALLEL to match)
 
 Usage:
     python3 improve_definitions.py \
@@ -23,7 +24,8 @@ Usage:
     --out enhanced_words_from_duo.csv \
     --model qwen2.5:32b \
     --batch 100 \
-    --temperature 0
+    --temperature 0 \
+    --concurrency 4
 
 
 Notes:
@@ -35,21 +37,77 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
+import hashlib
+import http.client
 import json
+import os
+import queue
+import random
 import re
+import socket
+import sqlite3
 import sys
+import threading
 import time
-import urllib.request
+import urllib.error
+import urllib.parse
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar, Union
 
-DEFAULT_OLLAMA_URL = "http://127.0.0.1:11434/api/chat"
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used instead
+    orjson = None
+
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    _json_loads = json.loads
 
-# Allowed leading subject prefixes (exact form)
-SUBJECT_PREFIX_PATTERN = re.compile(
-    r"^\((I|you|he / she / it|we|they / you-plural)\)\s+"
+DEFAULT_OLLAMA_URL = "http://127.0.0.1:11434/api/chat"
+WRITE_BUFFER_SIZE = 1 << 20
+# Below this many definitions, process pool startup costs more than it saves
+POSTFIX_POOL_THRESHOLD = 50_000
+PROGRESS_FLUSH_EVERY = 10  # batches
+USER_PROMPT_SLOT = "__USER_PROMPT__"
+
+# Transport failures worth retrying (server busy, restarting, dropped connection)
+RETRYABLE_ERRORS = (
+    urllib.error.URLError,
+    TimeoutError,
+    ConnectionError,
+    http.client.HTTPException,
 )
 
+T = TypeVar("T")
+
+# One persistent HTTP connection per worker thread (see ollama_connection)
+_thread_local = threading.local()
+# Every live connection, so generate() can abort reads blocked in worker threads
+_open_connections: Set[http.client.HTTPConnection] = set()
+_open_connections_lock = threading.Lock()
+
+class BatchCancelled(Exception):
+    """Raised in a worker once generate() has set its stop event."""
+
+# Allowed leading subject prefixes (exact form, followed by whitespace)
+SUBJECT_PREFIXES = ("(I)", "(you)", "(he / she / it)", "(we)", "(they / you-plural)")
+
+KEEP_IT_PARENS = True  # set False if you want to strip parentheses everywhere except subject
+
+ONESELF_PATTERN = re.compile(r"\boneself\b", re.IGNORECASE)
+PARENS_PATTERN = re.compile(r"\([^)]*\)")
+# Same, but "(it)" is matched on its own (and never as the tail of a longer group) so it can be kept
+PARENS_KEEP_IT_PATTERN = re.compile(r"\(it\)|\((?:\(it\)|(?!\(it\))[^)])*\)")
+# Whitespace that needs rewriting: a run before punctuation (dropped), a run of 2+
+# or a lone non-space character (both become one space). Single spaces never match.
+WS_PUNCT_PATTERN = re.compile(r"\s+([,;:.!?])|\s\s+|[^\S ]")
+
 @dataclass
 class RowIn:
     word: str
@@ -93,24 +151,85 @@ def read_input_csv(path: str) -> List[RowIn]:
             rows.append(RowIn(word=w, duolingo_definition=d.strip()))
         return rows
 
-def chunk_list(xs: List[str], n: int) -> List[List[str]]:
-    return [xs[i:i+n] for i in range(0, len(xs), n)]
+def iter_chunks(xs: List[str], n: int) -> Iterator[List[str]]:
+    for i in range(0, len(xs), n):
+        yield xs[i:i+n]
 
-def ollama_chat_stream_collect_content(
-    *,
-    url: str,
+def parse_word_def_line(line: Union[str, bytes]) -> Tuple[str, str]:
+    """
+    Parses one {"word": ..., "definition": ...} line; raises ValueError if malformed.
+    The definition comes back stripped.
+    """
+    obj = _json_loads(line)
+    if not isinstance(obj, dict):
+        raise ValueError("JSON not an object")
+    w = obj.get("word")
+    d = obj.get("definition")
+    if not isinstance(w, str) or not isinstance(d, str):
+        raise ValueError("word/definition not strings")
+    return w, d.strip()
+
+def ollama_connection(url: str, timeout_s: int) -> Tuple[http.client.HTTPConnection, str]:
+    """
+    Returns this thread's keep-alive connection to the Ollama host, plus the request path.
+    """
+    parts = urllib.parse.urlsplit(url)
+    key = (parts.scheme, parts.netloc, timeout_s)
+    conn = getattr(_thread_local, "conn", None)
+    if conn is None or _thread_local.key != key:
+        if conn is not None:
+            close_ollama_connection()
+        conn_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        conn = conn_cls(parts.netloc, timeout=timeout_s)
+        with _open_connections_lock:
+            _open_connections.add(conn)
+        _thread_local.conn = conn
+        _thread_local.key = key
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    return conn, path
+
+def close_ollama_connection() -> None:
+    # Dropped on any error; the next request opens a fresh connection
+    conn = getattr(_thread_local, "conn", None)
+    if conn is not None:
+        with _open_connections_lock:
+            _open_connections.discard(conn)
+        conn.close()
+        _thread_local.conn = None
+
+def abort_ollama_connections() -> None:
+    """
+    Shuts down every open connection's socket. Unlike close(), shutdown() also
+    wakes a readline() blocked on that socket in another thread.
+    """
+    with _open_connections_lock:
+        conns = list(_open_connections)
+    for conn in conns:
+        sock = conn.sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+@functools.lru_cache(maxsize=8)
+def chat_request_envelope(
     model: str,
     system_prompt: str,
-    user_prompt: str,
     temperature: Optional[float],
     top_p: Optional[float],
-    timeout_s: int = 600,
-) -> str:
+) -> Tuple[bytes, bytes]:
+    """
+    Returns the encoded /api/chat body split around the user message content, so
+    the system prompt is escaped and encoded once rather than once per batch.
+    """
     payload: Dict = {
         "model": model,
         "messages": [
             {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
+            {"role": "user", "content": USER_PROMPT_SLOT},
         ],
         "stream": True,
     }
@@ -122,187 +241,427 @@ def ollama_chat_stream_collect_content(
     if options:
         payload["options"] = options
 
-    data = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(
-        url,
-        data=data,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
+    # Last occurrence: only numbers follow the user message, while the system
+    # prompt could (in theory) contain the placeholder text itself
+    head, sep, tail = _json_dumps(payload).rpartition(_json_dumps(USER_PROMPT_SLOT))
+    assert sep, "user prompt placeholder missing from request envelope"
+    return head, tail
+
+def ollama_chat_stream_word_defs(
+    *,
+    url: str,
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    temperature: Optional[float],
+    top_p: Optional[float],
+    timeout_s: int = 600,
+) -> Dict[str, str]:
+    """
+    Streams the chat response and parses the model's NDJSON as lines complete.
+    Returns map word->definition; malformed lines are skipped.
+    """
+    head, tail = chat_request_envelope(model, system_prompt, temperature, top_p)
+    data = head + _json_dumps(user_prompt) + tail
+
+    out: Dict[str, str] = {}
+    buf = bytearray()
 
-    parts: List[str] = []
-    with urllib.request.urlopen(req, timeout=timeout_s) as resp:
-        for raw_line in resp:
-            line = raw_line.decode("utf-8", errors="replace").strip()
+    def take_line(line: bytes) -> None:
+        line = line.strip()
+        if not line:
+            return
+        try:
+            w, d = parse_word_def_line(line)
+        except ValueError:
+            return
+        if d:
+            out[w] = d
+
+    conn, path = ollama_connection(url, timeout_s)
+    try:
+        conn.request("POST", path, body=data, headers={"Content-Type": "application/json"})
+        resp = conn.getresponse()
+        if resp.status != 200:
+            detail = resp.read().decode("utf-8", errors="replace").strip()
+            raise urllib.error.HTTPError(url, resp.status, f"{resp.reason}: {detail[:300]}", resp.headers, None)
+        for raw_line in iter(resp.readline, b""):
+            line = raw_line.strip()
             if not line:
                 continue
             try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
+                obj = _json_loads(line)
+            except ValueError:
                 continue
             piece = (obj.get("message") or {}).get("content")
             if isinstance(piece, str) and piece:
-                parts.append(piece)
+                buf += piece.encode("utf-8")
+                nl = buf.find(b"\n")
+                while nl != -1:
+                    take_line(buf[:nl])
+                    del buf[:nl + 1]
+                    nl = buf.find(b"\n")
             if obj.get("done") is True:
                 break
-    return "".join(parts)
-
-def parse_ndjson_word_defs(content: str) -> Tuple[Dict[str, str], List[str]]:
+        # Drain the rest of the response so the connection can be reused
+        resp.read()
+    except BaseException:
+        close_ollama_connection()
+        raise
+    take_line(buf)
+    return out
+
+def backoff_delay(attempt: int, base: float, jitter: float = 1.0) -> float:
+    return base ** attempt + random.uniform(0, jitter)
+
+def sleep_unless_stopped(delay: float, stop: Optional[threading.Event]) -> None:
+    if stop is None:
+        time.sleep(delay)
+    elif stop.wait(delay):
+        raise BatchCancelled()
+
+def call_with_backoff(
+    fn: Callable[..., T],
+    *,
+    max_retries: int,
+    backoff_base: float,
+    stop: Optional[threading.Event] = None,
+    notices: Optional[queue.SimpleQueue] = None,
+    **kwargs,
+) -> T:
     """
-    Returns (map word->definition, parse_errors)
+    Calls fn(**kwargs), retrying RETRYABLE_ERRORS with exponential backoff + jitter.
+    HTTP 4xx errors (e.g. unknown model) are raised immediately. Raises
+    BatchCancelled instead of (re)trying once `stop` is set. Retry notices go
+    to `notices` if given, else straight to stderr.
     """
-    out: Dict[str, str] = {}
-    errors: List[str] = []
-
-    lines = [ln.strip() for ln in content.splitlines() if ln.strip()]
-    for idx, ln in enumerate(lines, start=1):
+    attempt = 0
+    while True:
+        if stop is not None and stop.is_set():
+            raise BatchCancelled()
         try:
-            obj = json.loads(ln)
-        except Exception as e:
-            errors.append(f"Line {idx}: invalid JSON ({e}): {ln[:160]}")
-            continue
-        if not isinstance(obj, dict):
-            errors.append(f"Line {idx}: JSON not an object")
-            continue
-        w = obj.get("word")
-        d = obj.get("definition")
-        if not isinstance(w, str) or not isinstance(d, str):
-            errors.append(f"Line {idx}: word/definition not strings")
-            continue
-        out[w] = d
-    return out, errors
+            return fn(**kwargs)
+        except RETRYABLE_ERRORS as e:
+            if attempt >= max_retries:
+                raise
+            if isinstance(e, urllib.error.HTTPError) and e.code < 500:
+                raise
+            delay = backoff_delay(attempt, backoff_base)
+            msg = f"[retry] request failed ({e}); retrying in {delay:.1f}s\n"
+            if notices is not None:
+                notices.put(msg)
+            else:
+                sys.stderr.write(msg)
+            sleep_unless_stopped(delay, stop)
+            attempt += 1
+
+def _keep_it_parens(m: re.Match) -> str:
+    return "(it)" if m.group(0) == "(it)" else ""
+
+def _collapse_ws(m: re.Match) -> str:
+    return m.group(1) or " "
 
 def post_fix_definition(defn: str) -> str:
     """
     Cleanups for your workflow:
     - remove 'oneself'
     - remove any parentheses not part of an allowed leading subject prefix
-      (keeps '(it)' in gustar phrases? NOTE: this will REMOVE it unless it's in text without parentheses.
-       If you want to KEEP '(it)', see KEEP_IT_PARENS option below.)
+      (keeps '(it)' in gustar phrases unless KEEP_IT_PARENS is False)
     - normalize whitespace
     """
-    KEEP_IT_PARENS = True  # set False if you want to strip parentheses everywhere except subject
-
-    # Remove banned/undesired learner phrasing
-    defn = re.sub(r"\boneself\b", "", defn, flags=re.IGNORECASE)
-
-    # Preserve allowed subject prefix if present
-    prefix = ""
-    rest = defn
-    m = SUBJECT_PREFIX_PATTERN.match(defn)
-    if m:
-        prefix = defn[:m.end()]
-        rest = defn[m.end():]
-
-    # Strip parentheses from rest (optionally keep "(it)")
-    if KEEP_IT_PARENS:
-        # temporarily protect "(it)" tokens
-        rest = rest.replace("(it)", "__KEEP_IT__")
-        rest = re.sub(r"\([^)]*\)", "", rest)
-        rest = rest.replace("__KEEP_IT__", "(it)")
-    else:
-        rest = re.sub(r"\([^)]*\)", "", rest)
-
-    # Recombine + whitespace normalize
-    cleaned = (prefix + rest).strip()
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
-    cleaned = re.sub(r"\s+([,;:.!?])", r"\1", cleaned)
+    # Remove banned/undesired learner phrasing (substring check skips the regex for most rows)
+    if "oneself" in defn.casefold():
+        defn = ONESELF_PATTERN.sub("", defn)
+
+    # Without parentheses there is no prefix to preserve and nothing to strip
+    if "(" in defn:
+        # Preserve allowed subject prefix if present
+        prefix = ""
+        rest = defn
+        if defn.startswith(SUBJECT_PREFIXES):
+            for pfx in SUBJECT_PREFIXES:
+                n = len(pfx)
+                if defn.startswith(pfx) and defn[n:n + 1].isspace():
+                    prefix = pfx
+                    rest = defn[n:]
+                    break
+
+        # Strip parentheses from rest (optionally keep "(it)")
+        if KEEP_IT_PARENS:
+            rest = PARENS_KEEP_IT_PATTERN.sub(_keep_it_parens, rest)
+        else:
+            rest = PARENS_PATTERN.sub("", rest)
+        defn = prefix + rest
+
+    # Whitespace normalize (also drops space before punctuation)
+    cleaned = WS_PUNCT_PATTERN.sub(_collapse_ws, defn.strip())
     cleaned = cleaned.strip(" -")
     return cleaned
 
-def generate(
+def post_fix_definitions(defs: List[str]) -> List[str]:
+    """
+    post_fix_definition over a whole column. Each distinct definition is cleaned
+    once; above POSTFIX_POOL_THRESHOLD distinct values the work is spread across
+    a process pool (the regex work holds the GIL).
+    """
+    unique = list(dict.fromkeys(defs))
+    if len(unique) <= POSTFIX_POOL_THRESHOLD or (os.cpu_count() or 1) < 2:
+        cleaned = map(post_fix_definition, unique)
+    else:
+        with ProcessPoolExecutor() as pool:
+            cleaned = list(pool.map(post_fix_definition, unique, chunksize=512))
+    lookup = dict(zip(unique, cleaned))
+    return [lookup[d] for d in defs]
+
+def generate_batch(
     *,
     url: str,
     model: str,
     system_prompt: str,
-    words: List[str],
-    batch_size: int,
+    batch: List[str],
     temperature: Optional[float],
     top_p: Optional[float],
     max_retries: int,
     retry_batch_size: int,
-    apply_postfixes: bool,
     sleep_between_s: float,
-) -> Dict[str, Tuple[str, str]]:
+    request_retries: int,
+    backoff_base: float,
+    stop: Optional[threading.Event] = None,
+    notices: Optional[queue.SimpleQueue] = None,
+) -> Dict[str, str]:
     """
-    Returns word -> (model_definition, cleaned_definition)
+    Runs one batch plus its retry rounds.
+    Returns word -> model_definition ("" if still missing)
+    Raises BatchCancelled at the next request or sleep once `stop` is set.
     """
-    results: Dict[str, Tuple[str, str]] = {}
-    batches = chunk_list(words, batch_size)
-
-    for bi, batch in enumerate(batches, start=1):
-        user_prompt = "\n".join(batch)
-        content = ollama_chat_stream_collect_content(
+    def request(words: List[str]) -> Dict[str, str]:
+        return call_with_backoff(
+            ollama_chat_stream_word_defs,
+            max_retries=request_retries,
+            backoff_base=backoff_base,
+            stop=stop,
+            notices=notices,
             url=url,
             model=model,
             system_prompt=system_prompt,
-            user_prompt=user_prompt,
+            user_prompt="\n".join(words),
             temperature=temperature,
             top_p=top_p,
         )
-        parsed_map, _ = parse_ndjson_word_defs(content)
 
-        missing = []
-        for w in batch:
-            d = parsed_map.get(w, "")
-            if not isinstance(d, str) or not d.strip():
-                missing.append(w)
-                continue
-            cleaned = post_fix_definition(d) if apply_postfixes else d
-            results[w] = (d, cleaned)
-
-        attempt = 0
-        while missing and attempt < max_retries:
-            attempt += 1
-            next_missing: List[str] = []
-            for rb in chunk_list(missing, retry_batch_size):
-                if sleep_between_s:
-                    time.sleep(sleep_between_s)
-                retry_content = ollama_chat_stream_collect_content(
-                    url=url,
-                    model=model,
-                    system_prompt=system_prompt,
-                    user_prompt="\n".join(rb),
-                    temperature=temperature,
-                    top_p=top_p,
-                )
-                retry_map, _ = parse_ndjson_word_defs(retry_content)
-                for w in rb:
-                    d = retry_map.get(w, "")
-                    if not isinstance(d, str) or not d.strip():
-                        next_missing.append(w)
-                        continue
-                    cleaned = post_fix_definition(d) if apply_postfixes else d
-                    results[w] = (d, cleaned)
-            missing = next_missing
-
-        # Fill any still-missing with empty strings
-        for w in missing:
-            if w not in results:
-                results[w] = ("", "")
-
-        got = sum(1 for w in batch if results.get(w, ("", ""))[0].strip())
-        print(f"[batch {bi}/{len(batches)}] got {got}/{len(batch)}", file=sys.stderr)
+    results: Dict[str, str] = {}
+    parsed_map = request(batch)
 
+    missing = []
+    for w in batch:
+        d = parsed_map.get(w)
+        if not d:
+            missing.append(w)
+            continue
+        results[w] = d
+
+    attempt = 0
+    while missing and attempt < max_retries:
+        attempt += 1
+        sleep_unless_stopped(backoff_delay(attempt - 1, backoff_base), stop)
+        next_missing: List[str] = []
+        for start in range(0, len(missing), retry_batch_size):
+            rb = missing[start:start + retry_batch_size]
+            if sleep_between_s:
+                sleep_unless_stopped(sleep_between_s, stop)
+            retry_map = request(rb)
+            for w in rb:
+                d = retry_map.get(w)
+                if not d:
+                    next_missing.append(w)
+                    continue
+                results[w] = d
+        missing = next_missing
+
+    # Fill any still-missing with empty strings
+    for w in missing:
+        if w not in results:
+            results[w] = ""
     return results
 
-def write_output_csv(path: str, rows: List[RowOut]) -> None:
-    with open(path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=["word", "duolingo_definition", "model_definition", "cleaned_definition"],
+class DefinitionCache:
+    """
+    On-disk (sqlite) cache of model definitions, so re-runs only query new words.
+    Keyed by sha256 of everything that shapes the answer: system prompt, model,
+    temperature, top_p and the word. Only raw model definitions are stored;
+    cleaned_definition is cheap to recompute and follows the current post-fixes.
+    """
+    DB_NAME = "definitions.sqlite3"
+    _QUERY_CHUNK = 500  # stay well below sqlite's bound-parameter limit
+
+    def __init__(
+        self,
+        cache_dir: str,
+        *,
+        system_prompt: str,
+        model: str,
+        temperature: Optional[float],
+        top_p: Optional[float],
+    ) -> None:
+        os.makedirs(cache_dir, exist_ok=True)
+        self.db = sqlite3.connect(os.path.join(cache_dir, self.DB_NAME))
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS definitions (key TEXT PRIMARY KEY, model_def TEXT NOT NULL)"
+        )
+        # Hash the shared part once; each word key continues from a copy of it
+        self._base = hashlib.sha256(
+            f"{system_prompt}\n{model}\n{temperature!r}\n{top_p!r}\n".encode("utf-8")
         )
-        writer.writeheader()
-        for r in rows:
-            writer.writerow(
-                {
-                    "word": r.word,
-                    "duolingo_definition": r.duolingo_definition,
-                    "model_definition": r.model_definition,
-                    "cleaned_definition": r.cleaned_definition,
-                }
+
+    def key(self, word: str) -> str:
+        h = self._base.copy()
+        h.update(word.encode("utf-8"))
+        return h.hexdigest()
+
+    def get_many(self, words: List[str]) -> Dict[str, str]:
+        """
+        Returns word -> model_definition for the words found in the cache.
+        """
+        key_to_word = {self.key(w): w for w in words}
+        keys = list(key_to_word)
+        found: Dict[str, str] = {}
+        for start in range(0, len(keys), self._QUERY_CHUNK):
+            chunk = keys[start:start + self._QUERY_CHUNK]
+            rows = self.db.execute(
+                f"SELECT key, model_def FROM definitions WHERE key IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            for k, d in rows:
+                found[key_to_word[k]] = d
+        return found
+
+    def put_many(self, defs: Dict[str, str]) -> None:
+        with self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO definitions (key, model_def) VALUES (?, ?)",
+                [(self.key(w), d) for w, d in defs.items() if d],
             )
 
+    def close(self) -> None:
+        self.db.close()
+
+def generate(
+    *,
+    url: str,
+    model: str,
+    system_prompt: str,
+    words: List[str],
+    batch_size: int,
+    temperature: Optional[float],
+    top_p: Optional[float],
+    max_retries: int,
+    retry_batch_size: int,
+    apply_postfixes: bool,
+    sleep_between_s: float,
+    concurrency: int,
+    request_retries: int,
+    backoff_base: float,
+    cache: Optional[DefinitionCache] = None,
+) -> Dict[str, Tuple[str, str]]:
+    """
+    Returns word -> (model_definition, cleaned_definition)
+
+    Up to `concurrency` batches are in flight at once; only useful when the
+    Ollama server runs with OLLAMA_NUM_PARALLEL > 1. Words found in `cache`
+    are not sent to the model.
+    """
+    model_defs: Dict[str, str] = {}
+    if cache is not None:
+        model_defs.update(cache.get_many(words))
+        print(f"[cache] {len(model_defs)}/{len(words)} words cached", file=sys.stderr)
+        words = [w for w in words if w not in model_defs]
+    total = -(-len(words) // batch_size)
+    done = 0
+
+    stop = threading.Event()
+    # Workers queue their retry notices; only this thread writes to stderr
+    notices: queue.SimpleQueue = queue.SimpleQueue()
+
+    def print_notices() -> None:
+        while not notices.empty():
+            sys.stderr.write(notices.get_nowait())
+
+    run_batch = functools.partial(
+        generate_batch,
+        url=url,
+        model=model,
+        system_prompt=system_prompt,
+        temperature=temperature,
+        top_p=top_p,
+        max_retries=max_retries,
+        retry_batch_size=retry_batch_size,
+        sleep_between_s=sleep_between_s,
+        request_retries=request_retries,
+        backoff_base=backoff_base,
+        stop=stop,
+        notices=notices,
+    )
+    workers = max(1, concurrency)
+    pending = enumerate(iter_chunks(words, batch_size), start=1)
+    in_flight: Dict[Future, Tuple[int, List[str]]] = {}
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        def fill() -> None:
+            # Only `workers` batches are submitted at a time; the rest aren't sliced yet
+            while len(in_flight) < workers:
+                nxt = next(pending, None)
+                if nxt is None:
+                    return
+                bi, batch = nxt
+                in_flight[pool.submit(run_batch, batch=batch)] = (bi, batch)
+
+        try:
+            fill()
+            while in_flight:
+                finished, _ = wait(in_flight, timeout=1.0, return_when=FIRST_COMPLETED)
+                print_notices()
+                for fut in finished:
+                    bi, batch = in_flight.pop(fut)
+                    batch_defs = fut.result()
+                    model_defs.update(batch_defs)
+                    if cache is not None:
+                        cache.put_many(batch_defs)
+
+                    got = sum(1 for w in batch if batch_defs.get(w))
+                    sys.stderr.write(f"[batch {bi}/{total}] got {got}/{len(batch)}\n")
+                    done += 1
+                    if done % PROGRESS_FLUSH_EVERY == 0:
+                        sys.stderr.flush()
+                fill()
+        except BaseException:
+            # Out of request retries or Ctrl-C: workers stop at their next request,
+            # retry round or sleep, and reads in progress are cut off
+            stop.set()
+            abort_ollama_connections()
+            pool.shutdown(wait=True, cancel_futures=True)
+            print_notices()
+            # Keep whatever finished in the meantime for the next run
+            if cache is not None:
+                for fut in in_flight:
+                    if not fut.cancelled() and fut.exception() is None:
+                        cache.put_many(fut.result())
+            raise
+    sys.stderr.flush()
+
+    defs = list(model_defs.values())
+    cleaned = post_fix_definitions(defs) if apply_postfixes else defs
+    return {w: (d, c) for w, d, c in zip(model_defs, defs, cleaned)}
+
+def write_output_csv(path: str, rows: Iterable[RowOut]) -> None:
+    with open(path, "w", encoding="utf-8", newline="", buffering=WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(["word", "duolingo_definition", "model_definition", "cleaned_definition"])
+        writer.writerows(
+            (r.word, r.duolingo_definition, r.model_definition, r.cleaned_definition)
+            for r in rows
+        )
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--in", dest="inp", required=True, help="Input CSV with at least 'word' column")
@@ -317,6 +676,10 @@ def main() -> int:
     ap.add_argument("--top-p", type=float, default=1.0, help="Top-p (1 recommended)")
     ap.add_argument("--no-clean", action="store_true", help="Disable cleaned_definition post-fixes")
     ap.add_argument("--sleep", type=float, default=0.0, help="Sleep between requests (seconds)")
+    ap.add_argument("--request-retries", type=int, default=5, help="Max retries per request on connection errors")
+    ap.add_argument("--backoff-base", type=float, default=2.0, help="Retry waits grow as BASE**attempt seconds (+ up to 1 s jitter)")
+    ap.add_argument("--concurrency", type=int, default=4, help="Batches in flight at once (match OLLAMA_NUM_PARALLEL)")
+    ap.add_argument("--cache-dir", default=None, help="Reuse model definitions across runs (e.g. .cache/defs/)")
     args = ap.parse_args()
 
     system_prompt = read_text(args.system)
@@ -325,40 +688,55 @@ def main() -> int:
         print("No input rows found.", file=sys.stderr)
         return 2
 
-    words = [r.word for r in inputs]
+    # Each distinct word is sent once; output rows still follow `inputs`
+    words = list(dict.fromkeys(r.word for r in inputs))
 
-    word_to_defs = generate(
-        url=args.url,
-        model=args.model,
-        system_prompt=system_prompt,
-        words=words,
-        batch_size=args.batch,
-        temperature=args.temperature,
-        top_p=args.top_p,
-        max_retries=args.retries,
-        retry_batch_size=args.retry_batch,
-        apply_postfixes=(not args.no_clean),
-        sleep_between_s=args.sleep,
-    )
+    cache = None
+    if args.cache_dir:
+        cache = DefinitionCache(
+            args.cache_dir,
+            system_prompt=system_prompt,
+            model=args.model,
+            temperature=args.temperature,
+            top_p=args.top_p,
+        )
 
-    out_rows: List[RowOut] = []
-    missing_count = 0
-    for r in inputs:
-        model_def, cleaned_def = word_to_defs.get(r.word, ("", ""))
-        if not model_def.strip():
-            missing_count += 1
-        out_rows.append(
-            RowOut(
+    try:
+        word_to_defs = generate(
+            url=args.url,
+            model=args.model,
+            system_prompt=system_prompt,
+            words=words,
+            batch_size=args.batch,
+            temperature=args.temperature,
+            top_p=args.top_p,
+            max_retries=args.retries,
+            retry_batch_size=args.retry_batch,
+            apply_postfixes=(not args.no_clean),
+            sleep_between_s=args.sleep,
+            concurrency=args.concurrency,
+            request_retries=args.request_retries,
+            backoff_base=args.backoff_base,
+            cache=cache,
+        )
+    finally:
+        if cache is not None:
+            cache.close()
+
+    def iter_out_rows() -> Iterator[RowOut]:
+        for r in inputs:
+            model_def, cleaned_def = word_to_defs.get(r.word, ("", ""))
+            yield RowOut(
                 word=r.word,
                 duolingo_definition=r.duolingo_definition,
                 model_definition=model_def,
                 cleaned_definition=cleaned_def,
             )
-        )
 
-    write_output_csv(args.out, out_rows)
+    write_output_csv(args.out, iter_out_rows())
 
-    print(f"Wrote {len(out_rows)} rows to {args.out}", file=sys.stderr)
+    missing_count = sum(1 for r in inputs if not word_to_defs.get(r.word, ("", ""))[0])
+    print(f"Wrote {len(inputs)} rows to {args.out}", file=sys.stderr)
     if missing_count:
         print(f"Missing model definitions: {missing_count}", file=sys.stderr)
         return 1